@@ -26,7 +26,7 @@ from __future__ import annotations
 
 import logging
 
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import pyqtSlot
 from PyQt5.QtWidgets import (
     QAbstractItemView, QDialogButtonBox, QGridLayout, QLabel, QListWidget,
     QListWidgetItem, QVBoxLayout, QWidget
@@ -36,7 +36,10 @@ from novelwriter import CONFIG, SHARED
 from novelwriter.extensions.configlayout import NColourLabel
 from novelwriter.extensions.modified import NDialog
 from novelwriter.extensions.switch import NSwitch
-from novelwriter.types import QtAccepted, QtDialogCancel, QtDialogOk, QtDialogReset, QtUserRole
+from novelwriter.types import (
+    QtAccepted, QtChecked, QtDialogCancel, QtDialogOk, QtDialogReset,
+    QtUserRole
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +55,9 @@ class GuiDocMerge(NDialog):
         self.setObjectName("GuiDocMerge")
         self.setWindowTitle(self.tr("Merge Documents"))
 
-        self._data = {}
+        self._sHandle = ""
+        self._origItems: list[str] = []
+        self._handles: list[str] = []
 
         self.headLabel = QLabel(self.tr("Documents to Merge"), self)
         self.headLabel.setFont(SHARED.theme.guiFontB)
@@ -69,6 +74,7 @@ class GuiDocMerge(NDialog):
 
         self.listBox = QListWidget(self)
         self.listBox.setIconSize(iSz)
+        self.listBox.setUniformItemSizes(True)
         self.listBox.setMinimumWidth(CONFIG.pxInt(400))
         self.listBox.setMinimumHeight(CONFIG.pxInt(180))
         self.listBox.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -119,16 +125,19 @@ class GuiDocMerge(NDialog):
 
     def data(self) -> dict:
         """Return the user's choices."""
-        finalItems = []
-        for i in range(self.listBox.count()):
-            item = self.listBox.item(i)
-            if item is not None and item.checkState() == Qt.CheckState.Checked:
-                finalItems.append(item.data(self.D_HANDLE))
-
-        self._data["moveToTrash"] = self.trashSwitch.isChecked()
-        self._data["finalItems"] = finalItems
-
-        return self._data
+        lst = self.listBox
+        role = self.D_HANDLE
+        finalItems = [
+            item.data(role) for i in range(lst.count())
+            if (item := lst.item(i)) is not None and item.checkState() == QtChecked
+        ]
+
+        return {
+            "sHandle": self._sHandle,
+            "origItems": self._origItems,
+            "moveToTrash": self.trashSwitch.isChecked(),
+            "finalItems": finalItems,
+        }
 
     @classmethod
     def getData(cls, parent: QWidget, handle: str, items: list[str]) -> tuple[dict, bool]:
@@ -148,9 +157,25 @@ class GuiDocMerge(NDialog):
     def _resetList(self) -> None:
         """Reset the content of the list box to its original state."""
         logger.debug("Resetting list box content")
-        sHandle = self._data.get("sHandle", None)
-        itemList = self._data.get("origItems", [])
-        self._loadContent(sHandle, itemList)
+        items = {}
+        for i in range(self.listBox.count()):
+            if item := self.listBox.item(i):
+                items[item.data(self.D_HANDLE)] = item
+
+        if len(items) == len(self._handles) and items.keys() == set(self._handles):
+            # Same items as when loaded, so only restore order and state
+            self.listBox.setUpdatesEnabled(False)
+            self.listBox.blockSignals(True)
+            for row, tHandle in enumerate(self._handles):
+                item = items[tHandle]
+                if (current := self.listBox.row(item)) != row:
+                    self.listBox.insertItem(row, self.listBox.takeItem(current))
+                item.setCheckState(QtChecked)
+            self.listBox.blockSignals(False)
+            self.listBox.setUpdatesEnabled(True)
+        else:
+            self._loadContent(self._sHandle, self._origItems)
+
         return
 
     ##
@@ -159,16 +184,29 @@ class GuiDocMerge(NDialog):
 
     def _loadContent(self, sHandle: str, itemList: list[str]) -> None:
         """Load content from a given list of items."""
-        self._data = {}
-        self._data["sHandle"] = sHandle
-        self._data["origItems"] = itemList
+        self._sHandle = sHandle
+        self._origItems = itemList
+        self.listBox.setUpdatesEnabled(False)
+        self.listBox.blockSignals(True)
         self.listBox.clear()
-        for tHandle in itemList:
-            if (nwItem := SHARED.project.tree[tHandle]) and nwItem.isFileType():
-                item = QListWidgetItem()
-                item.setIcon(nwItem.getMainIcon())
-                item.setText(nwItem.itemName)
-                item.setData(self.D_HANDLE, tHandle)
-                item.setCheckState(Qt.CheckState.Checked)
-                self.listBox.addItem(item)
+        self._handles = []
+
+        tree = SHARED.project.tree
+        addItem = self.listBox.addItem
+        handles = self._handles
+        role = self.D_HANDLE
+        valid = [
+            (tHandle, nwItem) for tHandle in itemList
+            if (nwItem := tree[tHandle]) and nwItem.isFileType()
+        ]
+        for tHandle, nwItem in valid:
+            item = QListWidgetItem()
+            item.setIcon(nwItem.getMainIcon())
+            item.setText(nwItem.itemName)
+            item.setData(role, tHandle)
+            item.setCheckState(QtChecked)
+            addItem(item)
+            handles.append(tHandle)
+        self.listBox.blockSignals(False)
+        self.listBox.setUpdatesEnabled(True)
         return
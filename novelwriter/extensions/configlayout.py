@@ -38,6 +38,9 @@ from novelwriter.types import QtScrollAsNeeded
 
 DEFAULT_SCALE = 0.9
 
+# Scaled label fonts, keyed by base font, scale and bold
+_FONT_CACHE: dict[tuple[str, float, bool], QFont] = {}
+
 
 class NFixedPage(QFrame):
     """Extension: Fixed Page Widget
@@ -101,12 +104,17 @@ class NScrollableForm(QScrollArea):
         self._first = True
         self._indent = CONFIG.pxInt(12)
 
+        # Scaled sizes used when building the form
+        self._spacing = CONFIG.pxInt(12)
+        self._margin = CONFIG.pxInt(4)
+        self._offset = CONFIG.pxInt(8)
+
         self._sections: dict[int, QLabel] = {}
         self._editable: dict[str, NColourLabel] = {}
         self._index: dict[str, QWidget] = {}
 
         self._layout = QVBoxLayout()
-        self._layout.setSpacing(CONFIG.pxInt(12))
+        self._layout.setSpacing(self._spacing)
 
         self._widget = QWidget(self)
         self._widget.setLayout(self._layout)
@@ -155,21 +163,21 @@ class NScrollableForm(QScrollArea):
 
     def scrollToSection(self, identifier: int) -> None:
         """Scroll to the requested section identifier."""
-        if identifier in self._sections:
-            yPos = self._sections[identifier].pos().y() - CONFIG.pxInt(8)
+        if qLabel := self._sections.get(identifier):
+            yPos = qLabel.pos().y() - self._offset
             self.verticalScrollBar().setValue(yPos)
         return
 
     def scrollToLabel(self, label: str) -> None:
         """Scroll to the requested label."""
-        if label in self._index:
-            yPos = self._index[label].pos().y() - CONFIG.pxInt(8)
+        if qWidget := self._index.get(label):
+            yPos = qWidget.pos().y() - self._offset
             self.verticalScrollBar().setValue(yPos)
         return
 
     def addGroupLabel(self, label: str, identifier: int | None = None) -> None:
         """Add a text label to separate groups of settings."""
-        hM = CONFIG.pxInt(4)
+        hM = self._margin
         qLabel = QLabel(f"<b>{label}</b>", self)
         qLabel.setContentsMargins(0, hM, 0, hM)
         if not self._first:
@@ -192,7 +200,7 @@ class NScrollableForm(QScrollArea):
     ) -> None:
         """Add a label and a widget as a new row of the form."""
         row = QHBoxLayout()
-        row.setSpacing(CONFIG.pxInt(12))
+        row.setSpacing(self._spacing)
 
         if isinstance(widget, list):
             wBox = QHBoxLayout()
@@ -281,13 +289,13 @@ class NColourLabel(QLabel):
         self._color = color or default
         self._faded = faded or default
 
-        font = self.font()
-        font.setPointSizeF(scale*font.pointSizeF())
-        font.setWeight(QFont.Weight.Bold if bold else QFont.Weight.Normal)
-        if color:
-            colour = self.palette()
-            colour.setColor(QPalette.ColorRole.WindowText, color)
-            self.setPalette(colour)
+        base = self.font()
+        key = (base.key(), scale, bold)
+        if (font := _FONT_CACHE.get(key)) is None:
+            font = QFont(base)
+            font.setPointSizeF(scale*base.pointSizeF())
+            font.setWeight(QFont.Weight.Bold if bold else QFont.Weight.Normal)
+            _FONT_CACHE[key] = font
 
         self.setFont(font)
         self.setIndent(indent)
@@ -312,12 +320,11 @@ class NColourLabel(QLabel):
 
     def _refeshTextColor(self) -> None:
         """Refresh the colour of the text on the label."""
+        color = self._color if self._state else self._faded
         palette = self.palette()
-        palette.setColor(
-            QPalette.ColorRole.WindowText,
-            self._color if self._state else self._faded,
-        )
-        self.setPalette(palette)
+        if palette.color(QPalette.ColorRole.WindowText) != color:
+            palette.setColor(QPalette.ColorRole.WindowText, color)
+            self.setPalette(palette)
         return
 
 
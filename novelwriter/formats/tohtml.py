@@ -421,8 +421,9 @@ class ToHtml(Tokenizer):
                     state[m[0]] = False
             elif fmt == TextFmt.FNOTE:
                 if data in self._footnotes:
-                    index = len(self._usedNotes) + 1
-                    self._usedNotes[data] = index
+                    if (index := self._usedNotes.get(data)) is None:
+                        index = len(self._usedNotes) + 1
+                        self._usedNotes[data] = index
                     tags.append((pos, f"<sup><a href='#footnote_{index}'>{index}</a></sup>"))
                 else:
                     tags.append((pos, "<sup>ERR</sup>"))
@@ -202,8 +202,9 @@ class ToMarkdown(Tokenizer):
             md = ""
             if fmt == TextFmt.FNOTE:
                 if data in self._footnotes:
-                    index = len(self._usedNotes) + 1
-                    self._usedNotes[data] = index
+                    if (index := self._usedNotes.get(data)) is None:
+                        index = len(self._usedNotes) + 1
+                        self._usedNotes[data] = index
                     md = f"[{index}]"
                 else:
                     md = "[ERR]"
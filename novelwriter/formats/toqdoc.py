@@ -25,7 +25,9 @@ from __future__ import annotations
 
 import logging
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from PyQt5.QtCore import QMarginsF, QSizeF
 from PyQt5.QtGui import (
@@ -47,7 +49,19 @@ from novelwriter.types import (
 
 logger = logging.getLogger(__name__)
 
-T_TextStyle = tuple[QTextBlockFormat, QTextCharFormat]
+ALIGNMENT = (
+    (BlockFmt.LEFT,    QtAlignLeft),
+    (BlockFmt.RIGHT,   QtAlignRight),
+    (BlockFmt.CENTRE,  QtAlignCenter),
+    (BlockFmt.JUSTIFY, QtAlignJustify),
+)
+PAGE_BREAKS = {
+    BlockFmt.PBB: QtPageBreakBefore,
+    BlockFmt.PBA: QtPageBreakAfter,
+    BlockFmt.PBB | BlockFmt.PBA: QtPageBreakBefore | QtPageBreakAfter,
+}
+TEXT_BLOCKS = frozenset({BlockTyp.TEXT, BlockTyp.COMMENT, BlockTyp.KEYWORD})
+HEAD_BLOCKS = frozenset(HEADINGS)
 
 
 def newBlock(cursor: QTextCursor, bFmt: QTextBlockFormat) -> None:
@@ -69,9 +83,15 @@ class ToQTextDocument(Tokenizer):
         self._document = QTextDocument()
         self._document.setUndoRedoEnabled(False)
         self._document.setDocumentMargin(0.0)
+        self._cursor = QTextCursor(self._document)
 
         self._usedNotes: dict[str, int] = {}
         self._usedFields: list[tuple[int, str]] = []
+        self._fmtSetters: list[tuple[Callable, Any] | None] = []
+        self._bFmtCache: dict[tuple[BlockTyp, BlockFmt], tuple[QTextBlockFormat, bool, bool]] = {}
+        self._cHead: dict[BlockTyp, QTextCharFormat] = {}
+        self._aHead: dict[BlockTyp, QTextCharFormat] = {}
+        self._fnoteFmt = QTextCharFormat()
 
         self._init = False
         self._newPage = False
@@ -192,6 +212,59 @@ class ToQTextDocument(Tokenizer):
         self._charFmt.setBackground(QtTransparent)
         self._charFmt.setForeground(self._theme.text)
 
+        # Footnote markers only differ in their link target, which is
+        # set on the shared format before each insert
+        self._fnoteFmt = QTextCharFormat(self._charFmt)
+        self._fnoteFmt.setForeground(self._theme.code)
+        self._fnoteFmt.setVerticalAlignment(QtVAlignSuper)
+        self._fnoteFmt.setAnchor(True)
+        self._fnoteFmt.setFontUnderline(True)
+
+        # Block formats are generated from the above on first use
+        self._bFmtCache = {}
+
+        # Heading Formats
+        # ===============
+
+        self._cHead = {}
+        self._aHead = {}
+        for hType in HEADINGS:
+            hCol = self._colorHeads and hType != BlockTyp.TITLE
+            cFmt = QTextCharFormat(self._charFmt)
+            cFmt.setForeground(self._theme.head if hCol else self._theme.text)
+            cFmt.setFontWeight(self._hWeight)
+            cFmt.setFontPointSize(self._sHead[hType])
+            self._cHead[hType] = cFmt
+
+            # Anchored headings only differ in their anchor name
+            aFmt = QTextCharFormat(cFmt)
+            aFmt.setAnchor(True)
+            self._aHead[hType] = aFmt
+
+        # Text Format Setters
+        # ===================
+        # Format codes that map directly to a single setter call on the
+        # character format, as a list indexed by format code. The
+        # remaining codes are handled inline.
+
+        setters = {
+            TextFmt.B_B:   (QTextCharFormat.setFontWeight, QFont.Weight.Bold),
+            TextFmt.B_E:   (QTextCharFormat.setFontWeight, self._dWeight),
+            TextFmt.I_B:   (QTextCharFormat.setFontItalic, True),
+            TextFmt.I_E:   (QTextCharFormat.setFontItalic, self._dItalic),
+            TextFmt.D_B:   (QTextCharFormat.setFontStrikeOut, True),
+            TextFmt.D_E:   (QTextCharFormat.setFontStrikeOut, self._dStrike),
+            TextFmt.U_B:   (QTextCharFormat.setFontUnderline, True),
+            TextFmt.U_E:   (QTextCharFormat.setFontUnderline, self._dUnderline),
+            TextFmt.M_B:   (QTextCharFormat.setBackground, self._theme.highlight),
+            TextFmt.M_E:   (QTextCharFormat.setBackground, QtTransparent),
+            TextFmt.SUP_B: (QTextCharFormat.setVerticalAlignment, QtVAlignSuper),
+            TextFmt.SUP_E: (QTextCharFormat.setVerticalAlignment, QtVAlignNormal),
+            TextFmt.SUB_B: (QTextCharFormat.setVerticalAlignment, QtVAlignSub),
+            TextFmt.SUB_E: (QTextCharFormat.setVerticalAlignment, QtVAlignNormal),
+        }
+        self._fmtSetters = [setters.get(fmt) for fmt in range(max(TextFmt) + 1)]
+
         self._init = True
 
         return
@@ -201,65 +274,57 @@ class ToQTextDocument(Tokenizer):
         if not self._init:
             return
 
+        # Note: Don't call documentLayout() here. The document has no
+        # layout until it is shown or printed, and creating one before
+        # the text is inserted makes every insert trigger a relayout.
         self._document.blockSignals(True)
-        cursor = QTextCursor(self._document)
+        cursor = self._cursor
         cursor.movePosition(QTextCursor.MoveOperation.End)
+        insertText = cursor.insertText
+        insertFragments = self._insertFragments
+
+        charFmt = self._charFmt
+        bCache = self._bFmtCache
+        bDefault = (self._blockFmt, False, False)
+        bNone = BlockFmt.NONE
+        typText = BlockTyp.TEXT
+        typSep = BlockTyp.SEP
+        typSkip = BlockTyp.SKIP
 
         for tType, tMeta, tText, tFormat, tStyle in self._blocks:
 
-            bFmt = QTextBlockFormat(self._blockFmt)
-            if tType in (BlockTyp.COMMENT, BlockTyp.KEYWORD):
-                bFmt.setTopMargin(self._mMeta[0])
-                bFmt.setBottomMargin(self._mMeta[1])
-            elif tType == BlockTyp.SEP:
-                bFmt.setTopMargin(self._mSep[0])
-                bFmt.setBottomMargin(self._mSep[1])
-
-            if tStyle & BlockFmt.LEFT:
-                bFmt.setAlignment(QtAlignLeft)
-            elif tStyle & BlockFmt.RIGHT:
-                bFmt.setAlignment(QtAlignRight)
-            elif tStyle & BlockFmt.CENTRE:
-                bFmt.setAlignment(QtAlignCenter)
-            elif tStyle & BlockFmt.JUSTIFY:
-                bFmt.setAlignment(QtAlignJustify)
-
-            if tStyle & BlockFmt.PBB:
+            if tStyle is bNone and (tType == typText or tType == typSkip):
+                # Plain paragraphs and skips use the default block format
+                cached = bDefault
+            elif (cached := bCache.get((tType, tStyle))) is None:
+                cached = bCache[(tType, tStyle)] = (
+                    self._genBlockFmt(tType, tStyle),
+                    bool(tStyle & BlockFmt.PBB),
+                    bool(tStyle & BlockFmt.PBA),
+                )
+
+            bFmt, pbb, pba = cached
+            if pbb:
                 self._insertNewPageMarker(cursor)
-                bFmt.setPageBreakPolicy(QtPageBreakBefore)
-            if tStyle & BlockFmt.PBA:
-                bFmt.setPageBreakPolicy(QtPageBreakAfter)
-
-            if tStyle & BlockFmt.Z_BTM:
-                bFmt.setBottomMargin(0.0)
-            if tStyle & BlockFmt.Z_TOP:
-                bFmt.setTopMargin(0.0)
-
-            if tStyle & BlockFmt.IND_L:
-                bFmt.setLeftMargin(self._mIndent)
-            if tStyle & BlockFmt.IND_R:
-                bFmt.setRightMargin(self._mIndent)
-            if tStyle & BlockFmt.IND_T:
-                bFmt.setTextIndent(self._tIndent)
-
-            if tType in (BlockTyp.TEXT, BlockTyp.COMMENT, BlockTyp.KEYWORD):
+
+            if tType in TEXT_BLOCKS:
                 newBlock(cursor, bFmt)
-                self._insertFragments(tText, tFormat, cursor, self._charFmt)
+                insertFragments(tText, tFormat, cursor, charFmt)
 
-            elif tType in HEADINGS:
-                bFmt, cFmt = self._genHeadStyle(tType, tMeta, bFmt)
+            elif tType in HEAD_BLOCKS:
+                cFmt = self._genHeadStyle(tType, tMeta)
                 newBlock(cursor, bFmt)
-                cursor.insertText(tText, cFmt)
+                insertText(tText, cFmt)
 
-            elif tType == BlockTyp.SEP:
+            elif tType == typSep:
                 newBlock(cursor, bFmt)
-                cursor.insertText(tText, self._charFmt)
+                insertText(tText, charFmt)
 
-            elif tType == BlockTyp.SKIP:
+            elif tType == typSkip:
                 newBlock(cursor, bFmt)
-                cursor.insertText(nwUnicode.U_NBSP, self._charFmt)
+                insertText(nwUnicode.U_NBSP, charFmt)
 
-            if tStyle & BlockFmt.PBA:
+            if pba:
                 self._insertNewPageMarker(cursor)
 
         self._document.blockSignals(False)
@@ -289,10 +354,10 @@ class ToQTextDocument(Tokenizer):
     def closeDocument(self) -> None:
         """Run close document tasks."""
         self._document.blockSignals(True)
+        cursor = self._cursor
 
         # Replace fields if there are stats available
         if self._usedFields and self._counts:
-            cursor = QTextCursor(self._document)
             for pos, field in reversed(self._usedFields):
                 if (value := self._counts.get(field)) is not None:
                     cursor.setPosition(pos, QtMoveAnchor)
@@ -301,21 +366,21 @@ class ToQTextDocument(Tokenizer):
 
         # Add footnotes
         if self._usedNotes:
-            cursor = QTextCursor(self._document)
             cursor.movePosition(QTextCursor.MoveOperation.End)
 
-            bFmt, cFmt = self._genHeadStyle(BlockTyp.HEAD4, "", self._blockFmt)
+            bFmt = self._genBlockFmt(BlockTyp.HEAD4, BlockFmt.NONE)
+            cFmt = self._genHeadStyle(BlockTyp.HEAD4, "")
             newBlock(cursor, bFmt)
             cursor.insertText(self._localLookup("Footnotes"), cFmt)
 
+            nFmt = QTextCharFormat(self._charFmt)
+            nFmt.setForeground(self._theme.code)
+            nFmt.setAnchor(True)
             for key, index in self._usedNotes.items():
                 if content := self._footnotes.get(key):
-                    cFmt = QTextCharFormat(self._charFmt)
-                    cFmt.setForeground(self._theme.code)
-                    cFmt.setAnchor(True)
-                    cFmt.setAnchorNames([f"footnote_{index}"])
+                    nFmt.setAnchorNames([f"footnote_{index}"])
                     newBlock(cursor, self._blockFmt)
-                    cursor.insertText(f"{index}. ", cFmt)
+                    cursor.insertText(f"{index}. ", nFmt)
                     self._insertFragments(*content, cursor, self._charFmt)
 
         self._document.blockSignals(False)
@@ -330,102 +395,79 @@ class ToQTextDocument(Tokenizer):
         self, text: str, tFmt: T_Formats, cursor: QTextCursor, dFmt: QTextCharFormat
     ) -> None:
         """Apply formatting tags to text."""
-        cFmt = QTextCharFormat(dFmt)
+        cFmt = QTextCharFormat(dFmt) if tFmt else dFmt
         temp = text.replace("\n", nwUnicode.U_LSEP)
+        insertText = cursor.insertText
+        setters = self._fmtSetters
+        theme = self._theme
+        anchors = self._anchors
         start = 0
         primary: QColor | None = None
         for pos, fmt, data in tFmt:
 
             # Insert buffer with previous format
-            cursor.insertText(temp[start:pos], cFmt)
+            if pos > start:
+                insertText(temp[start:pos], cFmt)
 
             # Construct next format
-            if fmt == TextFmt.B_B:
-                cFmt.setFontWeight(QFont.Weight.Bold)
-            elif fmt == TextFmt.B_E:
-                cFmt.setFontWeight(self._dWeight)
-            elif fmt == TextFmt.I_B:
-                cFmt.setFontItalic(True)
-            elif fmt == TextFmt.I_E:
-                cFmt.setFontItalic(self._dItalic)
-            elif fmt == TextFmt.D_B:
-                cFmt.setFontStrikeOut(True)
-            elif fmt == TextFmt.D_E:
-                cFmt.setFontStrikeOut(self._dStrike)
-            elif fmt == TextFmt.U_B:
-                cFmt.setFontUnderline(True)
-            elif fmt == TextFmt.U_E:
-                cFmt.setFontUnderline(self._dUnderline)
-            elif fmt == TextFmt.M_B:
-                cFmt.setBackground(self._theme.highlight)
-            elif fmt == TextFmt.M_E:
-                cFmt.setBackground(QtTransparent)
-            elif fmt == TextFmt.SUP_B:
-                cFmt.setVerticalAlignment(QtVAlignSuper)
-            elif fmt == TextFmt.SUP_E:
-                cFmt.setVerticalAlignment(QtVAlignNormal)
-            elif fmt == TextFmt.SUB_B:
-                cFmt.setVerticalAlignment(QtVAlignSub)
-            elif fmt == TextFmt.SUB_E:
-                cFmt.setVerticalAlignment(QtVAlignNormal)
+            if setter := setters[fmt]:
+                setter[0](cFmt, setter[1])
             elif fmt == TextFmt.COL_B:
                 if color := self._classes.get(data):
                     cFmt.setForeground(color)
                     primary = color
             elif fmt == TextFmt.COL_E:
-                cFmt.setForeground(self._theme.text)
+                cFmt.setForeground(theme.text)
                 primary = None
             elif fmt == TextFmt.ANM_B:
-                if self._anchors:
+                if anchors:
                     cFmt.setAnchor(True)
                     cFmt.setAnchorNames([data])
             elif fmt == TextFmt.ANM_E:
-                if self._anchors:
+                if anchors:
                     cFmt.setAnchor(False)
             elif fmt == TextFmt.ARF_B:
-                if self._anchors:
+                if anchors:
                     cFmt.setFontUnderline(True)
                     cFmt.setAnchor(True)
                     cFmt.setAnchorHref(data)
             elif fmt == TextFmt.ARF_E:
-                if self._anchors:
+                if anchors:
                     cFmt.setFontUnderline(False)
                     cFmt.setAnchor(False)
                     cFmt.setAnchorHref("")
             elif fmt == TextFmt.HRF_B:
-                cFmt.setForeground(self._theme.link)
+                cFmt.setForeground(theme.link)
                 cFmt.setFontUnderline(True)
                 cFmt.setAnchor(True)
                 cFmt.setAnchorHref(data)
             elif fmt == TextFmt.HRF_E:
-                cFmt.setForeground(primary or self._theme.text)
+                cFmt.setForeground(primary or theme.text)
                 cFmt.setFontUnderline(self._dUnderline)
                 cFmt.setAnchor(False)
                 cFmt.setAnchorHref("")
             elif fmt == TextFmt.FNOTE:
-                xFmt = QTextCharFormat(self._charFmt)
-                xFmt.setForeground(self._theme.code)
-                xFmt.setVerticalAlignment(QtVAlignSuper)
                 if data in self._footnotes:
-                    index = len(self._usedNotes) + 1
-                    self._usedNotes[data] = index
-                    xFmt.setAnchor(True)
+                    if (index := self._usedNotes.get(data)) is None:
+                        index = len(self._usedNotes) + 1
+                        self._usedNotes[data] = index
+                    xFmt = self._fnoteFmt
                     xFmt.setAnchorHref(f"#footnote_{index}")
-                    xFmt.setFontUnderline(True)
-                    cursor.insertText(f"[{index}]", xFmt)
+                    insertText(f"[{index}]", xFmt)
                 else:
-                    cursor.insertText("[ERR]", cFmt)
+                    insertText("[ERR]", cFmt)
             elif fmt == TextFmt.FIELD:
                 if field := data.partition(":")[2]:
                     self._usedFields.append((cursor.position(), field))
-                    cursor.insertText("0", cFmt)
+                    insertText("0", cFmt)
                 pass
 
             # Move pos for next pass
             start = pos
 
         # Insert whatever is left in the buffer
-        cursor.insertText(temp[start:], cFmt)
+        if start < len(temp):
+            insertText(temp[start:], cFmt)
 
         return
 
@@ -464,21 +506,50 @@ class ToQTextDocument(Tokenizer):
 
         return
 
-    def _genHeadStyle(self, hType: BlockTyp, hKey: str, rFmt: QTextBlockFormat) -> T_TextStyle:
-        """Generate a heading style set."""
-        mTop, mBottom = self._mHead.get(hType, (0.0, 0.0))
+    def _genBlockFmt(self, tType: BlockTyp, tStyle: BlockFmt) -> QTextBlockFormat:
+        """Generate a block format for a block type and style."""
+        bFmt = QTextBlockFormat(self._blockFmt)
+        if tType in (BlockTyp.COMMENT, BlockTyp.KEYWORD):
+            bFmt.setTopMargin(self._mMeta[0])
+            bFmt.setBottomMargin(self._mMeta[1])
+        elif tType == BlockTyp.SEP:
+            bFmt.setTopMargin(self._mSep[0])
+            bFmt.setBottomMargin(self._mSep[1])
+
+        if tStyle & BlockFmt.ALIGNED:
+            # Multi-line paragraphs can have more than one alignment flag,
+            # in which case the first one in the table wins
+            for flag, align in ALIGNMENT:
+                if tStyle & flag:
+                    bFmt.setAlignment(align)
+                    break
+        if policy := PAGE_BREAKS.get(tStyle & (BlockFmt.PBB | BlockFmt.PBA)):
+            bFmt.setPageBreakPolicy(policy)
+
+        if tStyle & BlockFmt.Z_BTM:
+            bFmt.setBottomMargin(0.0)
+        if tStyle & BlockFmt.Z_TOP:
+            bFmt.setTopMargin(0.0)
+
+        if tStyle & BlockFmt.IND_L:
+            bFmt.setLeftMargin(self._mIndent)
+        if tStyle & BlockFmt.IND_R:
+            bFmt.setRightMargin(self._mIndent)
+        if tStyle & BlockFmt.IND_T:
+            bFmt.setTextIndent(self._tIndent)
 
-        bFmt = QTextBlockFormat(rFmt)
-        bFmt.setTopMargin(mTop)
-        bFmt.setBottomMargin(mBottom)
+        if tType in HEADINGS:
+            # Heading margins are applied last
+            mTop, mBottom = self._mHead[tType]
+            bFmt.setTopMargin(mTop)
+            bFmt.setBottomMargin(mBottom)
 
-        hCol = self._colorHeads and hType != BlockTyp.TITLE
-        cFmt = QTextCharFormat(self._charFmt)
-        cFmt.setForeground(self._theme.head if hCol else self._theme.text)
-        cFmt.setFontWeight(self._hWeight)
-        cFmt.setFontPointSize(self._sHead.get(hType, 1.0))
+        return bFmt
+
+    def _genHeadStyle(self, hType: BlockTyp, hKey: str) -> QTextCharFormat:
+        """Generate a heading character format."""
         if hKey and self._anchors:
+            cFmt = self._aHead[hType]
             cFmt.setAnchorNames([hKey])
-            cFmt.setAnchor(True)
-
-        return bFmt, cFmt
+            return cFmt
+        return self._cHead[hType]
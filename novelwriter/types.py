@@ -76,6 +76,7 @@ QtHexRgb = QColor.NameFormat.HexRgb
 
 # Qt Tree and Table Types
 
+QtChecked = Qt.CheckState.Checked
 QtDecoration = Qt.ItemDataRole.DecorationRole
 QtUserRole = Qt.ItemDataRole.UserRole
 
@@ -87,6 +87,30 @@ def testDlgMerge_Main(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
     assert data["moveToTrash"] is True
     assert data["finalItems"] == [C.hChapterDoc, C.hSceneDoc]
 
+    # Reorder and uncheck, and restore again
+    itemOne = nwMerge.listBox.item(0)
+    assert itemOne is not None
+    itemOne.setCheckState(Qt.CheckState.Unchecked)
+    nwMerge.listBox.addItem(nwMerge.listBox.takeItem(0))
+    assert nwMerge.data()["finalItems"] == [C.hSceneDoc]
+
+    nwMerge._resetList()
+    assert nwMerge.listBox.item(0) is itemOne
+    assert nwMerge.data()["finalItems"] == [C.hChapterDoc, C.hSceneDoc]
+
+    # Reordered items are returned in the new order
+    nwMerge.listBox.addItem(nwMerge.listBox.takeItem(0))
+    assert nwMerge.data()["finalItems"] == [C.hSceneDoc, C.hChapterDoc]
+    nwMerge._resetList()
+
+    # Remove an item, which requires a full reload
+    nwMerge.listBox.takeItem(1)
+    assert nwMerge.data()["finalItems"] == [C.hChapterDoc]
+
+    nwMerge._resetList()
+    assert nwMerge.listBox.count() == 2
+    assert nwMerge.data()["finalItems"] == [C.hChapterDoc, C.hSceneDoc]
+
     # Test Class Method
     with monkeypatch.context() as mp:
         mp.setattr(GuiDocMerge, "result", lambda *a: QtAccepted)
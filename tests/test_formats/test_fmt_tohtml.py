@@ -344,6 +344,31 @@ def testFmtToHtml_Footnotes(mockGUI):
         "</ol>\n"
     )
 
+    # Repeated references reuse the same footnote number
+    html = ToHtml(project)
+    html.initDocument()
+    html._text = (
+        "One[footnote:fa], two[footnote:fb] and one[footnote:fa].\n\n"
+        "%footnote.fa: Footnote text A.\n\n"
+        "%footnote.fb: Footnote text B.\n\n"
+    )
+    html.tokenizeText()
+    html.doConvert()
+    assert html._pages[-1] == (
+        "<p>One<sup><a href='#footnote_1'>1</a></sup>, "
+        "two<sup><a href='#footnote_2'>2</a></sup> "
+        "and one<sup><a href='#footnote_1'>1</a></sup>.</p>\n"
+    )
+
+    html.closeDocument()
+    assert html._pages[-1] == (
+        "<h3>Footnotes</h3>\n"
+        "<ol>\n"
+        "<li id='footnote_1'><p>Footnote text A.</p></li>\n"
+        "<li id='footnote_2'><p>Footnote text B.</p></li>\n"
+        "</ol>\n"
+    )
+
 
 @pytest.mark.core
 def testFmtToHtml_CloseTags(mockGUI):
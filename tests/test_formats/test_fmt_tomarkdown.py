@@ -214,6 +214,22 @@ def testFmtToMarkdown_ConvertParagraphs(mockGUI):
         "1. Footnote text A.\n\n"
     )
 
+    # Repeated references reuse the same footnote number
+    md = ToMarkdown(project, False)
+    md._text = (
+        "One[footnote:fa] and one again[footnote:fa].\n\n"
+        "%footnote.fa: Footnote text A.\n\n"
+    )
+    md.tokenizeText()
+    md.doConvert()
+    assert md._pages[-1] == "One[1] and one again[1].\n\n"
+
+    md.closeDocument()
+    assert md._pages[-1] == (
+        "### Footnotes\n\n"
+        "1. Footnote text A.\n\n"
+    )
+
 
 @pytest.mark.core
 def testFmtToMarkdown_ConvertDirect(mockGUI):
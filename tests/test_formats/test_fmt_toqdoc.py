@@ -404,6 +404,29 @@ def testFmtToQTextDocument_TextBlockFormats(mockGUI):
     assert bFmt.leftMargin() == 0.0
     assert bFmt.rightMargin() == 0.0
 
+    # Mixed Alignment
+    # ===============
+    # Lines of a paragraph are merged, so the first alignment should win
+    doc.document.clear()
+
+    doc._text = (
+        "Line one <<\n>> line two\n\n"
+        ">> Line one <<\n>> line two\n\n"
+    )
+    doc.tokenizeText()
+    doc.doConvert()
+    assert doc.document.blockCount() == 2
+
+    # 0: Left and Right
+    block = doc.document.findBlockByNumber(0)
+    bFmt = block.blockFormat()
+    assert bFmt.alignment() == QtAlignLeft
+
+    # 1: Centre and Right
+    block = doc.document.findBlockByNumber(1)
+    bFmt = block.blockFormat()
+    assert bFmt.alignment() == QtAlignRight
+
     # Unreachable
     # ===========
     # Some formatting markers are currently not reachable
@@ -612,3 +635,23 @@ def testFmtToQTextDocument_Footnotes(mockGUI):
     # 3: Footnote 1
     block = doc.document.findBlockByNumber(3)
     assert block.text() == "1. Here's the first note."
+
+    # Repeated references reuse the same footnote number
+    doc.document.clear()
+    doc._usedNotes = {}
+    doc._text = (
+        "Text with[footnote:fn1] repeated[footnote:fn2] footnote[footnote:fn1].\n\n"
+        "%Footnote.fn1: Here's the first note.\n\n"
+        "%Footnote.fn2: Here's the second note.\n\n"
+    )
+    doc.tokenizeText()
+    doc.doConvert()
+    doc.closeDocument()
+    assert doc.document.blockCount() == 4
+
+    block = doc.document.findBlockByNumber(0)
+    assert block.text() == "Text with[1] repeated[2] footnote[1]."
+    block = doc.document.findBlockByNumber(2)
+    assert block.text() == "1. Here's the first note."
+    block = doc.document.findBlockByNumber(3)
+    assert block.text() == "2. Here's the second note."